@@ -5,43 +5,101 @@ This adds detailed logging to track each step of the agent execution.
 """
 
 import asyncio
+import functools
+import logging
 import os
-from tenxagent import TenxAgent, OpenAIModel, Tool, safe_evaluate
-from pydantic import BaseModel, Field
 
-# Debug tool with logging
-class CalculatorInput(BaseModel):
-    expression: str = Field(description="Mathematical expression to evaluate")
+# uvloop is a drop-in, faster event loop for I/O-bound workloads; fall back
+# to the stdlib loop when it isn't installed (e.g. on Windows)
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
 
-class DebugCalculatorTool(Tool):
-    name = "calculator"
-    description = "Evaluates mathematical expressions safely"
-    args_schema = CalculatorInput
-    
-    def execute(self, expression: str, metadata: dict = None) -> str:
-        print(f"🔧 [TOOL] Calculator called with: expression='{expression}', metadata={metadata}")
-        try:
-            result = safe_evaluate(expression)
-            response = f"Result: {result}"
-            print(f"🔧 [TOOL] Calculator returning: '{response}'")
-            return response
-        except Exception as e:
-            error_response = f"Error: {str(e)}"
-            print(f"🔧 [TOOL] Calculator error: '{error_response}'")
-            return error_response
+# Lazy %s-style logging: arguments are only formatted when the level is
+# enabled, and records go through one buffered writer instead of a print
+# (and a syscall) per line. Set LOGLEVEL=INFO to silence the per-call trace.
+logging.basicConfig(level=os.getenv("LOGLEVEL", "DEBUG"), format="%(message)s")
+logger = logging.getLogger("debug_agent")
 
-async def debug_test():
-    """Test with debug logging to see what's happening."""
-    
-    if not os.getenv("OPENAI_API_KEY"):
-        print("❌ Error: OPENAI_API_KEY not found in environment variables.")
-        return
-    
-    print("🐛 Starting debug test...")
-    
-    llm = OpenAIModel(model="gpt-4o-mini", temperature=0.1)
-    calculator = DebugCalculatorTool()
-    
+def build_debug_components():
+    """
+    Build the counting llm wrapper and the debug calculator tool.
+
+    tenxagent/pydantic/openai imports cost a few hundred ms of cold start, so
+    they're deferred here - the API-key check in debug_test can bail out
+    before any of that is paid.
+    """
+    from tenxagent import OpenAIModel, CachedModel, Tool, safe_evaluate
+    from pydantic import BaseModel, Field
+
+    # Debug tool with logging
+    class CalculatorInput(BaseModel):
+        expression: str = Field(description="Mathematical expression to evaluate")
+
+    class DebugCalculatorTool(Tool):
+        name = "calculator"
+        description = "Evaluates mathematical expressions safely"
+        args_schema = CalculatorInput
+
+        # safe_evaluate is pure, so repeated expressions resolve to a dict lookup
+        _cached_eval = staticmethod(functools.lru_cache(maxsize=4096)(safe_evaluate))
+
+        def execute(self, expression: str, metadata: dict = None) -> str:
+            logger.debug("🔧 [TOOL] Calculator called with: expression='%s', metadata=%s", expression, metadata)
+            try:
+                result = self._cached_eval(expression)
+                response = f"Result: {result}"
+                logger.debug("🔧 [TOOL] Calculator returning: '%s'", response)
+                return response
+            except Exception as e:
+                error_response = f"Error: {str(e)}"
+                logger.debug("🔧 [TOOL] Calculator error: '%s'", error_response)
+                return error_response
+
+    class DebugCountingModel(CachedModel):
+        """CachedModel that counts and logs every generate call for debugging."""
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.call_count = 0
+
+        async def generate(self, messages, tools=None, metadata=None):
+            self.call_count += 1
+            logger.debug(
+                "🤖 [LLM] Call #%d: messages=%d last=%s tools=%d metadata=%s",
+                self.call_count,
+                len(messages),
+                messages[-1].role if messages else "None",
+                len(tools) if tools else 0,
+                metadata,
+            )
+
+            result = await super().generate(messages, tools=tools, metadata=metadata)
+
+            logger.debug(
+                "🤖 [LLM] Response: content=%.100s tool_calls=%d",
+                result.message.content or "None",
+                len(result.message.tool_calls) if result.message.tool_calls else 0,
+            )
+            if result.message.tool_calls:
+                for tc in result.message.tool_calls:
+                    logger.debug("      - %s(%s)", tc.name, tc.arguments)
+
+            return result
+
+    # Counts LLM calls directly; caches repeated deterministic calls so
+    # re-running the debug loop skips the network
+    llm = DebugCountingModel(OpenAIModel(model="gpt-4o-mini", temperature=0.1), temperature_threshold=0.1)
+    return llm, DebugCalculatorTool()
+
+async def run_test_case(llm, calculator, i, test_case):
+    """Run a single test case in its own agent and session."""
+    from tenxagent import TenxAgent
+
+    # Agent state (internal history) is not coroutine-safe, so each concurrent
+    # case gets its own agent; the llm instance is stateless and shared.
     agent = TenxAgent(
         llm=llm,
         tools=[calculator],
@@ -49,7 +107,28 @@ async def debug_test():
         max_llm_calls=5,  # Low limit to catch loops early
         max_tokens=2000
     )
-    
+
+    try:
+        result = await agent.run(
+            test_case["query"],
+            session_id=f"debug_session_{i}",
+            metadata=test_case["metadata"]
+        )
+        return result, None
+    except Exception as e:
+        return None, e
+
+async def debug_test():
+    """Test with debug logging to see what's happening."""
+
+    if not os.getenv("OPENAI_API_KEY"):
+        print("❌ Error: OPENAI_API_KEY not found in environment variables.")
+        return
+
+    print("🐛 Starting debug test...")
+
+    llm, calculator = build_debug_components()
+
     # Test cases that might cause issues
     test_cases = [
         {
@@ -69,59 +148,26 @@ async def debug_test():
         }
     ]
     
-    for i, test_case in enumerate(test_cases, 1):
+    # Every case has a unique session_id, so they're independent - run them
+    # concurrently and pay only the latency of the slowest one
+    outcomes = await asyncio.gather(*(
+        run_test_case(llm, calculator, i, test_case)
+        for i, test_case in enumerate(test_cases, 1)
+    ))
+
+    for i, (test_case, (result, error)) in enumerate(zip(test_cases, outcomes), 1):
         print(f"\n{'='*60}")
         print(f"🧪 Test {i}: {test_case['description']}")
         print(f"Query: {test_case['query']}")
         print(f"Metadata: {test_case['metadata']}")
         print("="*60)
-        
-        try:
-            # Track LLM calls by wrapping the generate method
-            original_generate = llm.generate
-            call_count = 0
-            
-            async def debug_generate(messages, tools=None, metadata=None):
-                nonlocal call_count
-                call_count += 1
-                print(f"🤖 [LLM] Call #{call_count}")
-                print(f"    Messages count: {len(messages)}")
-                print(f"    Last message: {messages[-1].role if messages else 'None'}")
-                print(f"    Tools count: {len(tools) if tools else 0}")
-                print(f"    Metadata: {metadata}")
-                
-                result = await original_generate(messages, tools, metadata)
-                
-                print(f"🤖 [LLM] Response:")
-                print(f"    Content: {result.message.content[:100]}..." if result.message.content else "    Content: None")
-                print(f"    Tool calls: {len(result.message.tool_calls) if result.message.tool_calls else 0}")
-                if result.message.tool_calls:
-                    for tc in result.message.tool_calls:
-                        print(f"      - {tc.name}({tc.arguments})")
-                
-                return result
-            
-            # Temporarily replace the generate method
-            llm.generate = debug_generate
-            
-            result = await agent.run(
-                test_case["query"], 
-                session_id=f"debug_session_{i}",
-                metadata=test_case["metadata"]
-            )
-            
-            # Restore original method
-            llm.generate = original_generate
-            
-            print(f"\n✅ [RESULT] Final response: {result}")
-            print(f"✅ [STATS] Total LLM calls: {call_count}")
-            
-        except Exception as e:
-            print(f"\n❌ [ERROR] {str(e)}")
-            print(f"❌ [STATS] LLM calls before error: {call_count}")
-            
-            # Restore original method even on error
-            llm.generate = original_generate
+
+        if error is not None:
+            print(f"❌ [ERROR] {str(error)}")
+        else:
+            print(f"✅ [RESULT] Final response: {result}")
+
+    print(f"\n✅ [STATS] Total LLM calls: {llm.call_count}")
 
 async def main():
     await debug_test()
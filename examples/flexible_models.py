@@ -18,9 +18,26 @@ Before running this example:
 """
 
 import asyncio
+import functools
+import re
+
+# uvloop is a drop-in, faster event loop for I/O-bound workloads; fall back
+# to the stdlib loop when it isn't installed (e.g. on Windows)
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
 from tenxagent import TenxAgent, OpenAIModel, ManualToolCallingModel, Tool, safe_evaluate
 from pydantic import BaseModel, Field
 
+# Precompiled allowlist - regex matching runs in C, unlike a per-character scan
+_ALLOWED_RE = re.compile(r'[0-9+\-*/().,e ]+')
+
+# Precompiled patterns for EchoModel: one pass to detect math, one to strip stopwords
+_MATH_RE = re.compile(r'[-+*/]|calculate|math', re.I)
+_STRIP_RE = re.compile(r'\b(what is|calculate|compute)\b|\?', re.I)
+
 # Define a simple calculator tool
 class CalculatorInput(BaseModel):
     expression: str = Field(description="Mathematical expression to evaluate (e.g., '2 + 3 * 4')")
@@ -29,15 +46,17 @@ class CalculatorTool(Tool):
     name = "calculator" 
     description = "Evaluates mathematical expressions safely"
     args_schema = CalculatorInput
-    
+
+    # safe_evaluate is pure, so repeated expressions resolve to a dict lookup
+    _cached_eval = staticmethod(functools.lru_cache(maxsize=4096)(safe_evaluate))
+
     def execute(self, expression: str) -> str:
         try:
             # Simple safe evaluation (only allow basic math)
-            allowed_chars = set('0123456789+-*/().,e ')
-            if not all(c in allowed_chars for c in expression):
+            if not _ALLOWED_RE.fullmatch(expression):
                 return "Error: Only basic mathematical operations are allowed"
-            
-            result = safe_evaluate(expression)
+
+            result = self._cached_eval(expression)
             return f"Result: {result}"
         except Exception as e:
             return f"Error: {str(e)}"
@@ -55,24 +74,24 @@ class EchoModel:
             last_message = user_messages[-1].content
             
             # Simple logic: if it contains math, suggest a tool call
-            if any(op in last_message for op in ['+', '-', '*', '/', 'calculate', 'math']):
+            if _MATH_RE.search(last_message):
                 # Extract the expression (very simple extraction)
-                expression = last_message
-                for word in ['what is', 'calculate', 'compute', '?']:
-                    expression = expression.replace(word, '').strip()
-                
+                expression = _STRIP_RE.sub('', last_message).strip()
+
                 response_content = f'{{"tool_calls": [{{"name": "calculator", "arguments": {{"expression": "{expression}"}}}}]}}'
             else:
                 response_content = f"I understand you said: {last_message}"
             
-            return GenerationResult(
-                message=Message(role="assistant", content=response_content),
+            # model_construct skips validation - safe here because the payload
+            # is built programmatically with known-good fields
+            return GenerationResult.model_construct(
+                message=Message.model_construct(role="assistant", content=response_content, tool_calls=None, tool_call_id=None),
                 input_tokens=50,
                 output_tokens=20
             )
-        
-        return GenerationResult(
-            message=Message(role="assistant", content="Hello!"),
+
+        return GenerationResult.model_construct(
+            message=Message.model_construct(role="assistant", content="Hello!", tool_calls=None, tool_call_id=None),
             input_tokens=10,
             output_tokens=5
         )
@@ -19,48 +19,82 @@ Before running this example:
 """
 
 import asyncio
+import functools
 import os
-from tenxagent import TenxAgent, OpenAIModel, Tool, safe_evaluate
+from dataclasses import dataclass, fields
+
+# uvloop is a drop-in, faster event loop for I/O-bound workloads; fall back
+# to the stdlib loop when it isn't installed (e.g. on Windows)
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+from tenxagent import TenxAgent, OpenAIModel, CachedModel, Tool, safe_evaluate
 from pydantic import BaseModel, Field
 
+# Typed view of the metadata fields tools care about: parsed once per call,
+# then read via attribute access instead of repeated dict.get lookups (and
+# typos like "userRole" become AttributeErrors instead of silent defaults)
+@dataclass
+class ToolContext:
+    user_id: str = ""
+    user_role: str = "basic"
+    precision: int = 2
+    show_calculation: bool = False
+    timestamp: str = "unknown"
+    session_id: str = "unknown"
+
+    @classmethod
+    def from_metadata(cls, metadata: dict = None) -> "ToolContext":
+        metadata = metadata or {}
+        return cls(**{key: metadata[key] for key in metadata.keys() & _CONTEXT_KEYS})
+
+_CONTEXT_KEYS = frozenset(f.name for f in fields(ToolContext))
+
 # Example tool that uses metadata
 class CalculatorInput(BaseModel):
     expression: str = Field(description="Mathematical expression to evaluate")
 
+# The full response depends only on these arguments, so identical calls
+# (e.g. "2**10" for the same role/precision across demo runs) are served
+# straight from the cache without re-evaluating or re-formatting
+@functools.lru_cache(maxsize=2048)
+def _compute(expression: str, user_role: str, precision: int, show_calculation: bool, user_id) -> str:
+    if "**" in expression and user_role == "basic":
+        return "Error: Power operations require elevated privileges"
+
+    result = safe_evaluate(expression)
+
+    # safe_evaluate returns strings, so apply precision to float-valued results
+    # in a single round-and-format step; integers and error text pass through
+    if "." in result:
+        try:
+            result = str(round(float(result), precision))
+        except ValueError:
+            pass
+
+    # Include metadata context in response
+    response = f"Result: {result}"
+    if show_calculation:
+        response += f" (calculated: {expression})"
+    if user_id:
+        response += f" [calculated for user: {user_id}]"
+
+    return response
+
 class MetadataAwareCalculatorTool(Tool):
     name = "calculator"
     description = "Evaluates mathematical expressions with metadata awareness"
     args_schema = CalculatorInput
-    
+
     def execute(self, expression: str, metadata: dict = None) -> str:
         try:
-            # Use metadata to customize behavior
-            metadata = metadata or {}
-            
-            # Example: Use precision from metadata
-            precision = metadata.get("precision", 2)
-            
-            # Example: Check if user has permission for certain operations
-            user_role = metadata.get("user_role", "basic")
-            
-            if "**" in expression and user_role == "basic":
-                return "Error: Power operations require elevated privileges"
-            
-            result = safe_evaluate(expression)
-            
-            # Format result based on metadata
-            if isinstance(result, float):
-                result = round(float(result), precision)
-            
-            # Include metadata context in response
-            response = f"Result: {result}"
-            if metadata.get("show_calculation", False):
-                response += f" (calculated: {expression})"
-            if metadata.get("user_id"):
-                response += f" [calculated for user: {metadata['user_id']}]"
-                
-            return response
-            
+            # Parse metadata once into a typed context
+            ctx = ToolContext.from_metadata(metadata)
+
+            return _compute(expression, ctx.user_role, ctx.precision, ctx.show_calculation, ctx.user_id)
+
         except Exception as e:
             return f"Error: {str(e)}"
 
@@ -74,12 +108,13 @@ class LoggingTool(Tool):
     args_schema = LoggingInput
     
     def execute(self, message: str = "", metadata: dict = None, **kwargs) -> str:
+        ctx = ToolContext.from_metadata(metadata)
         metadata = metadata or {}
-        
+
         log_entry = {
-            "timestamp": metadata.get("timestamp", "unknown"),
-            "user_id": metadata.get("user_id", "anonymous"),
-            "session_id": metadata.get("session_id", "unknown"),
+            "timestamp": ctx.timestamp,
+            "user_id": ctx.user_id or "anonymous",
+            "session_id": ctx.session_id,
             "action": "tool_execution",
             "tool": self.name,
             "kwargs": kwargs
@@ -93,7 +128,7 @@ async def demo_openai_metadata():
     print("🔧 Demo 1: OpenAI API Metadata")
     print("=" * 40)
     
-    llm = OpenAIModel(model="gpt-4o-mini", temperature=0.1)
+    llm = CachedModel(OpenAIModel(model="gpt-4o-mini", temperature=0.1), temperature_threshold=0.1)
     calculator = MetadataAwareCalculatorTool()
     
     agent = TenxAgent(
@@ -128,7 +163,7 @@ async def demo_tool_metadata():
     print("\n🔧 Demo 2: Tool Behavior Based on Metadata")
     print("=" * 50)
     
-    llm = OpenAIModel(model="gpt-4o-mini", temperature=0.1)
+    llm = CachedModel(OpenAIModel(model="gpt-4o-mini", temperature=0.1), temperature_threshold=0.1)
     calculator = MetadataAwareCalculatorTool()
     
     agent = TenxAgent(
@@ -173,7 +208,7 @@ async def demo_logging_metadata():
     print("\n🔧 Demo 3: Metadata for Logging and Tracking")
     print("=" * 50)
     
-    llm = OpenAIModel(model="gpt-4o-mini", temperature=0.1)
+    llm = CachedModel(OpenAIModel(model="gpt-4o-mini", temperature=0.1), temperature_threshold=0.1)
     calculator = MetadataAwareCalculatorTool()
     logger = LoggingTool()
     
@@ -18,10 +18,39 @@ Before running this example:
 """
 
 import asyncio
+import functools
+import os
+import re
+import sys
+
+# uvloop is a drop-in, faster event loop for I/O-bound workloads; fall back
+# to the stdlib loop when it isn't installed (e.g. on Windows)
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 from tenxagent import TenxAgent, OpenAIModel, Tool, Message, safe_evaluate
 from pydantic import BaseModel, Field
 from typing import List
 
+@functools.lru_cache(maxsize=None)
+def get_llm() -> OpenAIModel:
+    """One OpenAIModel (and one connection pool) shared by every demo agent."""
+    return OpenAIModel(model="gpt-4o-mini", temperature=0.7)
+
+# One shared, static prompt string: provider-side prompt caching only hits
+# when the prompt prefix is byte-identical across calls, so nothing dynamic
+# (timestamps, session ids) belongs in here
+SYSTEM_PROMPT = "You are a helpful math assistant. Use the calculator tool for mathematical calculations."
+
+# Precompiled allowlist - regex matching runs in C, unlike a per-character scan
+_ALLOWED_RE = re.compile(r'[0-9+\-*/().,e ]+')
+
+# Role icons for rendering history, built once instead of per message
+_ICONS = {"user": "👤", "assistant": "🤖", "tool": "🔧"}
+
 # Define a simple calculator tool
 class CalculatorInput(BaseModel):
     expression: str = Field(description="Mathematical expression to evaluate (e.g., '2 + 3 * 4')")
@@ -34,8 +63,7 @@ class CalculatorTool(Tool):
     def execute(self, expression: str, metadata: dict = None) -> str:
         try:
             # Simple safe evaluation (only allow basic math)
-            allowed_chars = set('0123456789+-*/().,e ')
-            if not all(c in allowed_chars for c in expression):
+            if not _ALLOWED_RE.fullmatch(expression):
                 return "Error: Only basic mathematical operations are allowed"
             
             result = safe_evaluate(expression)
@@ -43,25 +71,60 @@ class CalculatorTool(Tool):
         except Exception as e:
             return f"Error: {str(e)}"
 
+async def maintain_history(history: List[Message], max_tokens: int = 3000) -> List[Message]:
+    """
+    Keep a provided history under a token budget by summarizing its middle.
+
+    Prompt cost and latency grow with every message you carry forward, so once
+    the history exceeds max_tokens the messages between the first and last turn
+    are compressed into a single summary message by a cheap model call. The
+    first and last turns are always preserved verbatim.
+    """
+    import tiktoken
+
+    encoding = tiktoken.encoding_for_model("gpt-4o-mini")
+    total_tokens = sum(len(encoding.encode(msg.content or "")) for msg in history)
+    if total_tokens <= max_tokens or len(history) <= 2:
+        return history
+
+    # Summarize everything between the first and last message
+    middle = history[1:-1]
+    transcript = "\n".join(f"{msg.role}: {msg.content}" for msg in middle)
+
+    result = await get_llm().generate([
+        Message(role="system", content="Compress the following conversation excerpt to at most 200 tokens, preserving all facts, numbers and results."),
+        Message(role="user", content=transcript),
+    ])
+    # Keep the summary on the assistant role: a system-role message here would
+    # stop TenxAgent from injecting its own composed system prompt
+    summary = Message(role="assistant", content=f"[summary]: {result.message.content}")
+
+    return [history[0], summary, history[-1]]
+
 # Simple response model
 class SimpleResponse(BaseModel):
     message: str = Field(description="Main response message")
     total_tokens: int = Field(default=0, description="Total tokens used")
 
+# Prime the shared schema cache so the first agent.run doesn't pay the
+# model_json_schema() reflection either
+from tenxagent.tools import args_json_schema
+args_json_schema(CalculatorInput)
+
 async def demo_internal_history():
     """Demonstrate using agent's internal history management."""
     print("🔄 DEMO 1: Internal History Management")
     print("=" * 50)
     
     # Initialize the language model
-    llm = OpenAIModel(model="gpt-4o-mini", temperature=0.7)
+    llm = get_llm()
     calculator = CalculatorTool()
     
     # Create agent - it will manage its own history automatically
     agent = TenxAgent(
         llm=llm,
         tools=[calculator],
-        system_prompt="You are a helpful math assistant. Use the calculator tool for mathematical calculations.",
+        system_prompt=SYSTEM_PROMPT,
         max_llm_calls=10,
         max_tokens=4000,
         output_model=SimpleResponse
@@ -90,14 +153,14 @@ async def demo_provided_history():
     print("=" * 50)
     
     # Initialize the language model
-    llm = OpenAIModel(model="gpt-4o-mini", temperature=0.7)
+    llm = get_llm()
     calculator = CalculatorTool()
     
     # Create agent
     agent = TenxAgent(
         llm=llm,
         tools=[calculator],
-        system_prompt="You are a helpful math assistant. Use the calculator tool for mathematical calculations.",
+        system_prompt=SYSTEM_PROMPT,
         max_llm_calls=10,
         max_tokens=4000,
         output_model=SimpleResponse
@@ -112,14 +175,22 @@ async def demo_provided_history():
     ]
     
     print("📚 Using provided history with context:")
-    for msg in my_history:
-        role_icon = {"user": "👤", "assistant": "🤖", "tool": "🔧"}.get(msg.role, "❓")
-        print(f"  {role_icon} {msg.role}: {msg.content[:60]}{'...' if len(msg.content) > 60 else ''}")
+    # Render the whole history with one write instead of a syscall per message
+    lines = [
+        f"  {_ICONS.get(msg.role, '❓')} {msg.role}: {msg.content[:60]}{'...' if len(msg.content) > 60 else ''}"
+        for msg in my_history
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
     
+    # Keep the provided history within budget before every run - a no-op for
+    # this short demo, but long sessions get their middle summarized so
+    # per-turn prompt cost stays bounded
+    my_history = await maintain_history(my_history, max_tokens=3000)
+
     # Now ask a follow-up question with the provided history
     print(f"\n📝 New Query: What was that result divided by 5?")
     print("-" * 30)
-    
+
     response = await agent.run(
         "What was that result divided by 5?", 
         history=my_history  # Provide the history
@@ -132,9 +203,15 @@ async def main():
     """Run both demos."""
     print("🤖 TenxAgent Simple History Demo")
     print("=" * 60)
-    
-    await demo_internal_history()
-    await demo_provided_history()
+
+    # Warm the shared client (DNS/TLS) and tokenizer in the background so the
+    # first billed call doesn't pay cold-start latency
+    if os.getenv("OPENAI_API_KEY"):
+        warmup_task = asyncio.create_task(get_llm().warmup())
+
+    # The two demos use separate agents and sessions, so they can overlap
+    # their OpenAI round trips instead of running back to back
+    await asyncio.gather(demo_internal_history(), demo_provided_history())
     
     print("\n✅ Demo completed!")
 
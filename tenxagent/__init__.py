@@ -1,8 +1,9 @@
 # TenxAgent package
 from .agent import TenxAgent
 from .models import LanguageModel, OpenAIModel, ManualToolCallingModel
+from .cache import CachedModel, SemanticCachedModel
 from .tools import Tool
-from .schemas import Message, GenerationResult, MongoMessage
+from .schemas import Message, GenerationResult, StreamEvent, MongoMessage
 from .history import InMemoryHistoryStore
 from .utils import safe_evaluate
 from .agent import create_tenx_agent_tool
@@ -13,9 +14,12 @@ __all__ = [
     "LanguageModel", 
     "OpenAIModel",
     "ManualToolCallingModel",
+    "CachedModel",
+    "SemanticCachedModel",
     "Tool",
     "Message", 
     "GenerationResult",
+    "StreamEvent",
     "MongoMessage",
     "InMemoryHistoryStore",
     "safe_evaluate",
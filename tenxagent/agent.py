@@ -5,6 +5,7 @@ from .schemas import Message, GenerationResult, ToolCall
 from typing import List, Optional, Dict, Any, Type, Union
 from .history import InMemoryHistoryStore
 from pydantic import BaseModel, Field
+import hashlib
 import json
 import asyncio
 
@@ -28,9 +29,21 @@ class TenxAgent:
         self.max_tokens = max_tokens
         self._internal_history = InMemoryHistoryStore()
         self.output_model = output_model
+        self._cached_system_prompt = None
 
     def _get_system_prompt(self) -> str:
-        """Get the system prompt from the LLM model, which handles tool calling instructions."""
+        """
+        Get the system prompt from the LLM model, which handles tool calling instructions.
+
+        The composed prompt is cached for the agent's lifetime: tools and
+        output_model are fixed at construction, and a byte-identical system
+        message on every turn is what lets provider-side prompt caching
+        (OpenAI's automatic prefix cache) hit. Nothing request-specific
+        (user ids, timestamps, metadata) may be interpolated here.
+        """
+        if self._cached_system_prompt is not None:
+            return self._cached_system_prompt
+
         tools_list = list(self.tools.values()) if self.tools else None
         
         # Get base prompt from LLM
@@ -90,10 +103,24 @@ class TenxAgent:
             3. Use exact enum values as specified (e.g., "text", "radio", etc.)
             4. Follow the field descriptions carefully
             5. Start your response with {{ and end with }}"""
-            
-            return base_prompt + output_instructions
-        
-        return base_prompt
+
+            self._cached_system_prompt = base_prompt + output_instructions
+        else:
+            self._cached_system_prompt = base_prompt
+
+        return self._cached_system_prompt
+
+    @property
+    def prefix_hash(self) -> str:
+        """
+        SHA-256 of the agent's stable prompt prefix (the composed system prompt).
+
+        Self-hosted backends like vLLM accept a cache salt that scopes KV-cache
+        prefix reuse; pass metadata={"cache_salt": agent.prefix_hash} to run()
+        so every session sharing this agent's byte-identical prefix reuses the
+        same cached blocks. The salt is only forwarded when explicitly set.
+        """
+        return hashlib.sha256(self._get_system_prompt().encode("utf-8")).hexdigest()
 
     def _populate_token_fields(self, response_data: dict, metadata: Dict[str, Any]) -> dict:
         """Populate token fields in response data if they exist in the output model."""
@@ -125,7 +152,7 @@ class TenxAgent:
         else:
             try:
                 validated_args = tool.args_schema(**tool_call.arguments)
-                result_content = await asyncio.to_thread(tool.execute, metadata=metadata, **validated_args.model_dump())
+                result_content = await tool.aexecute(metadata=metadata, **validated_args.model_dump())
             except Exception as e:
                 result_content = f"Error executing tool '{tool_call.name}': {e}"
         
@@ -241,6 +268,169 @@ class TenxAgent:
             
             return final_content
 
+    async def run_stream(self, user_input: str, session_id: str = "default", metadata: Optional[Dict[str, Any]] = None, history: Optional[List[Message]] = None):
+        """
+        Run the agent, yielding response text chunks as the LLM streams them.
+
+        Tool-call turns are handled transparently between streamed turns, so
+        callers see the text of every assistant turn as it arrives instead of
+        waiting for the full response. Structured output models are not applied
+        here - chunks are raw text.
+        """
+        metadata = metadata or {}
+        llm_calls_count = 0
+        total_tokens_used = 0
+
+        if 'token_usage' not in metadata:
+            metadata['token_usage'] = {
+                'total_tokens': 0,
+                'prompt_tokens': 0,
+                'completion_tokens': 0
+            }
+
+        # Use provided history or get from internal store
+        if history is not None:
+            messages = history.copy()
+            user_message = Message(role="user", content=user_input)
+            messages.append(user_message)
+        else:
+            messages = await self._internal_history.get_messages(session_id)
+            user_message = Message(role="user", content=user_input)
+            await self._internal_history.add_message(session_id, user_message)
+            messages.append(user_message)
+
+        if not any(msg.role == "system" for msg in messages):
+            messages.insert(0, Message(role="system", content=self._get_system_prompt()))
+
+        while True:
+            if llm_calls_count >= self.max_llm_calls:
+                yield "Error: Maximum number of LLM calls reached."
+                return
+
+            llm_calls_count += 1
+            tools_list = list(self.tools.values()) if self.tools else None
+
+            generation_result = None
+            tool_tasks = []
+            async for event in self.llm.generate_stream(messages, tools=tools_list, metadata=metadata):
+                if event.text:
+                    yield event.text
+                if event.tool_call is not None:
+                    # A tool call's arguments are complete as soon as its event
+                    # arrives, so start executing it now and let it overlap
+                    # with the remainder of the stream
+                    tool_tasks.append(asyncio.create_task(self._execute_tool(event.tool_call, metadata)))
+                if event.result is not None:
+                    generation_result = event.result
+
+            # Update token tracking
+            call_tokens = generation_result.input_tokens + generation_result.output_tokens
+            total_tokens_used += call_tokens
+            metadata['token_usage']['total_tokens'] += call_tokens
+            metadata['token_usage']['prompt_tokens'] += generation_result.input_tokens
+            metadata['token_usage']['completion_tokens'] += generation_result.output_tokens
+
+            if total_tokens_used >= self.max_tokens:
+                for task in tool_tasks:
+                    task.cancel()
+                yield "Error: Token limit reached."
+                return
+
+            response_message = generation_result.message
+
+            if history is None:
+                await self._internal_history.add_message(session_id, response_message)
+
+            messages.append(response_message)
+
+            if getattr(response_message, 'tool_calls', None):
+                # Tool calls streamed as events are already running; fall back
+                # to dispatching here for models whose streams only report the
+                # final result
+                execution_tasks = tool_tasks or [
+                    self._execute_tool(tool_call, metadata) for tool_call in response_message.tool_calls or []
+                ]
+                tool_result_messages = await asyncio.gather(*execution_tasks)
+
+                for msg in tool_result_messages:
+                    if history is None:
+                        await self._internal_history.add_message(session_id, msg)
+                    messages.append(msg)
+
+                continue # Go back to the LLM with the tool results
+
+            # No tool calls: the streamed turn was the final answer
+            return
+
+    async def run_many(self, queries: List[str], session_id: str = "run_many", metadata: Optional[Dict[str, Any]] = None) -> List[str]:
+        """
+        Answer several independent queries in one agent run.
+
+        The queries are folded into a single numbered user message, so they
+        share one LLM round trip (plus any tool turns) and one copy of the
+        system prompt instead of N separate calls. The model is asked to reply
+        with JSON {"A0": ..., "A1": ...}, which is parsed back into a list
+        ordered like `queries`. Queries must not depend on each other; anything
+        needing conversation history should go through run(). Not compatible
+        with output_model, since the combined reply has its own JSON shape.
+        """
+        if self.output_model:
+            raise ValueError("run_many is not supported with an output_model; the combined response has its own JSON format.")
+
+        numbered = "\n".join(f"[Q{i}] {query}" for i, query in enumerate(queries))
+        combined_input = (
+            f"Answer each of the following questions independently:\n{numbered}\n\n"
+            'Respond with ONLY a valid JSON object mapping "A<i>" to the answer for [Q<i>], '
+            'e.g. {"A0": "...", "A1": "..."}. No extra text or markdown.'
+        )
+
+        final_content = await self.run(combined_input, session_id=session_id, metadata=metadata)
+
+        import re
+        json_match = re.search(r'\{.*\}', final_content, re.DOTALL)
+        if not json_match:
+            return [f"Error: Could not parse combined response: {final_content}"] * len(queries)
+        try:
+            parsed = json.loads(json_match.group())
+        except json.JSONDecodeError as e:
+            return [f"Error: Invalid JSON in combined response: {e}"] * len(queries)
+
+        return [str(parsed.get(f"A{i}", "Error: No answer returned.")) for i in range(len(queries))]
+
+    async def run_batch(
+        self,
+        queries: List[str],
+        session_ids: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        use_batch_api: bool = False,
+    ) -> List[Union[str, BaseModel]]:
+        """
+        Run many independent queries and return their results in order.
+
+        By default each query goes through the normal agent loop, executed
+        concurrently with asyncio.gather. With use_batch_api=True (and an llm
+        that implements batch_generate, like OpenAIModel), all queries are
+        dispatched as a single OpenAI Batch API job at ~50% token cost. Batch
+        mode is single-turn only (no tool loop or history) and completes
+        asynchronously, so it's meant for offline/eval workloads.
+        """
+        if session_ids is None:
+            session_ids = [f"batch_{i}" for i in range(len(queries))]
+
+        if use_batch_api and hasattr(self.llm, "batch_generate"):
+            system_prompt = self._get_system_prompt()
+            batch_messages = [
+                [Message(role="system", content=system_prompt), Message(role="user", content=query)]
+                for query in queries
+            ]
+            results = await self.llm.batch_generate(batch_messages)
+            return [result.message.content or "" for result in results]
+
+        return list(await asyncio.gather(*(
+            self.run(query, session_id=session_id, metadata=metadata)
+            for query, session_id in zip(queries, session_ids)
+        )))
+
 class AgentToolInput(BaseModel):
     task: str = Field(description="The specific task for the agent to perform.")
 
@@ -254,6 +444,27 @@ def create_tenx_agent_tool(agent: TenxAgent, name: str, description: str) -> Too
             self.args_schema = AgentToolInput
             self.agent = agent_instance
 
+        async def aexecute(self, task: str, metadata: dict = None) -> str:
+            import uuid
+
+            # Natively async: await the nested agent on the current event loop
+            # instead of bouncing through a thread + asyncio.run, so the outer
+            # agent's other tool calls keep running during the sub-agent's
+            # network time
+            session_id = f"agent_tool_{uuid.uuid4().hex[:8]}"
+            nested_metadata = metadata.copy() if metadata else {}
+
+            result = await self.agent.run(task, session_id=session_id, metadata=nested_metadata)
+
+            # Propagate token usage back to parent metadata
+            if metadata and 'token_usage' in nested_metadata and 'token_usage' in metadata:
+                nested_usage = nested_metadata['token_usage']
+                metadata['token_usage']['total_tokens'] += nested_usage['total_tokens']
+                metadata['token_usage']['prompt_tokens'] += nested_usage['prompt_tokens']
+                metadata['token_usage']['completion_tokens'] += nested_usage['completion_tokens']
+
+            return str(result)  # Ensure string return for tool interface
+
         def execute(self, task: str, metadata: dict = None) -> str:
             import asyncio
             import uuid
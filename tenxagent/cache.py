@@ -0,0 +1,192 @@
+# in tenxagent/cache.py
+import hashlib
+import json
+import math
+import os
+from collections import OrderedDict
+from typing import Callable, List, Optional
+
+from .models import LanguageModel
+from .schemas import Message, GenerationResult
+
+
+class CachedModel(LanguageModel):
+    """
+    Wraps another LanguageModel with an exact-match response cache.
+
+    The cache key is a SHA-256 hash of (model, messages, tool names, temperature),
+    so identical calls skip the network entirely and return the stored
+    GenerationResult. To avoid caching non-deterministic output, results are only
+    stored when the wrapped model's temperature is at or below
+    `temperature_threshold` (default 0.0, i.e. fully deterministic calls only).
+    Entries are evicted LRU beyond `max_entries` so long-running processes
+    don't accumulate results without bound.
+    """
+
+    def __init__(self, base_model: LanguageModel, temperature_threshold: float = 0.0, max_entries: int = 1024):
+        self.base_model = base_model
+        self.temperature_threshold = temperature_threshold
+        self.max_entries = max_entries
+        self._store = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "tokens_saved": 0}
+
+    def _cache_key(self, messages: List[Message], tools: Optional[List['Tool']]) -> str:
+        payload = {
+            "model": getattr(self.base_model, "model", type(self.base_model).__name__),
+            "messages": [m.model_dump() for m in messages],
+            "tools": sorted(t.name for t in tools) if tools else [],
+            "temperature": getattr(self.base_model, "temperature", None),
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+    def _cacheable(self) -> bool:
+        temperature = getattr(self.base_model, "temperature", None)
+        return temperature is not None and temperature <= self.temperature_threshold
+
+    def supports_native_tool_calling(self) -> bool:
+        return self.base_model.supports_native_tool_calling()
+
+    def convert_tools_to_model_format(self, tools):
+        return self.base_model.convert_tools_to_model_format(tools)
+
+    def get_tool_calling_system_prompt(self, tools=None, user_prompt=None) -> str:
+        return self.base_model.get_tool_calling_system_prompt(tools=tools, user_prompt=user_prompt)
+
+    async def warmup(self) -> None:
+        """Forward warmup to the wrapped model when it supports it."""
+        warmup = getattr(self.base_model, "warmup", None)
+        if warmup is not None:
+            await warmup()
+
+    def clear(self):
+        """Drop all cached responses."""
+        self._store.clear()
+
+    async def generate(self, messages: List[Message], tools: Optional[List['Tool']] = None, metadata: Optional[dict] = None) -> GenerationResult:
+        if not self._cacheable():
+            return await self.base_model.generate(messages, tools=tools, metadata=metadata)
+
+        key = self._cache_key(messages, tools)
+        cached = self._store.get(key)
+        if cached is not None:
+            self._store.move_to_end(key)  # Keep LRU order fresh
+            self.stats["hits"] += 1
+            self.stats["tokens_saved"] += cached.input_tokens + cached.output_tokens
+            # Return a copy so callers can't mutate the cached entry
+            return cached.model_copy(deep=True)
+
+        self.stats["misses"] += 1
+        result = await self.base_model.generate(messages, tools=tools, metadata=metadata)
+        self._store[key] = result.model_copy(deep=True)
+        while len(self._store) > self.max_entries:
+            self._store.popitem(last=False)
+        return result
+
+
+def _cosine_similarity(a: List[float], b: List[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(x * x for x in b))
+    return dot / norm if norm else 0.0
+
+
+class SemanticCachedModel(CachedModel):
+    """
+    Extends CachedModel with an embedding-based similarity lookup.
+
+    Exact-match hits are checked first; on a miss, the last user message is
+    embedded and compared (cosine similarity) against previously cached queries.
+    Anything above `threshold` is treated as a paraphrase of an earlier query
+    and served from the cache, avoiding the LLM call altogether.
+
+    By default embeddings come from the OpenAI embeddings API; pass `embed_fn`
+    (an async callable taking a string and returning a vector) to use a
+    different embedding source. Entries are evicted LRU beyond `max_entries`.
+    """
+
+    def __init__(
+        self,
+        base_model: LanguageModel,
+        temperature_threshold: float = 0.0,
+        threshold: float = 0.92,
+        max_entries: int = 1024,
+        embedding_model: str = "text-embedding-3-small",
+        embed_fn: Optional[Callable] = None,
+    ):
+        super().__init__(base_model, temperature_threshold=temperature_threshold, max_entries=max_entries)
+        self.threshold = threshold
+        self.embedding_model = embedding_model
+        self.embed_fn = embed_fn
+        self._embed_client = None
+        self._entries = OrderedDict()  # exact key -> (embedding, GenerationResult)
+        self.stats["semantic_hits"] = 0
+
+    def _get_embed_client(self):
+        """Create the embeddings client once and reuse it across cache misses."""
+        if self._embed_client is None:
+            import openai
+            from .models import _get_shared_http_client
+            self._embed_client = openai.AsyncOpenAI(
+                api_key=os.getenv("OPENAI_API_KEY"),
+                http_client=_get_shared_http_client(),
+            )
+        return self._embed_client
+
+    async def _embed(self, text: str) -> List[float]:
+        if self.embed_fn is not None:
+            return await self.embed_fn(text)
+
+        response = await self._get_embed_client().embeddings.create(model=self.embedding_model, input=text)
+        return response.data[0].embedding
+
+    def clear(self):
+        super().clear()
+        self._entries.clear()
+
+    async def generate(self, messages: List[Message], tools: Optional[List['Tool']] = None, metadata: Optional[dict] = None) -> GenerationResult:
+        if not self._cacheable():
+            return await self.base_model.generate(messages, tools=tools, metadata=metadata)
+
+        key = self._cache_key(messages, tools)
+        cached = self._store.get(key)
+        if cached is not None:
+            self._store.move_to_end(key)  # Keep LRU order fresh
+            self.stats["hits"] += 1
+            self.stats["tokens_saved"] += cached.input_tokens + cached.output_tokens
+            return cached.model_copy(deep=True)
+
+        # Exact miss: look for a semantically similar earlier query. The cache
+        # fails open: if embedding fails (network, auth, quota), the call
+        # proceeds straight to the base model instead of erroring out.
+        user_messages = [m for m in messages if m.role == "user"]
+        query = user_messages[-1].content if user_messages and user_messages[-1].content else None
+        embedding = None
+        if query:
+            try:
+                embedding = await self._embed(query)
+            except Exception:
+                pass
+
+        if embedding is not None:
+            best_score, best_result = 0.0, None
+            for entry_key, (entry_embedding, entry_result) in self._entries.items():
+                score = _cosine_similarity(embedding, entry_embedding)
+                if score > best_score:
+                    best_score, best_result = score, (entry_key, entry_result)
+
+            if best_result is not None and best_score >= self.threshold:
+                entry_key, entry_result = best_result
+                self._entries.move_to_end(entry_key)  # Keep LRU order fresh
+                self.stats["semantic_hits"] += 1
+                self.stats["tokens_saved"] += entry_result.input_tokens + entry_result.output_tokens
+                return entry_result.model_copy(deep=True)
+
+        self.stats["misses"] += 1
+        result = await self.base_model.generate(messages, tools=tools, metadata=metadata)
+        self._store[key] = result.model_copy(deep=True)
+        while len(self._store) > self.max_entries:
+            self._store.popitem(last=False)
+        if embedding is not None:
+            self._entries[key] = (embedding, result.model_copy(deep=True))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
@@ -3,12 +3,68 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 import os
 from dotenv import load_dotenv
-from .schemas import Message, GenerationResult # MODIFIED
+from .schemas import Message, GenerationResult, StreamEvent # MODIFIED
 import json
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Shared HTTP client so every OpenAIModel instance reuses one connection pool
+# (TLS/TCP handshakes happen once, keep-alive connections are reused)
+_shared_http_client = None
+
+def _get_shared_http_client():
+    global _shared_http_client
+    if _shared_http_client is None:
+        # High gather fan-outs can hit the default pool ceiling; the cap is
+        # env-tunable so batch-heavy callers can dial it up without code changes
+        max_connections = int(os.getenv("OPENAI_MAX_CONCURRENCY", "200"))
+        max_keepalive = min(100, max_connections)
+
+        # The stock httpx transport degrades under heavy concurrency; prefer
+        # the SDK's aiohttp-backed client (openai[aiohttp] extra) when the
+        # optional aiohttp package is installed
+        try:
+            import aiohttp  # noqa: F401
+            import openai
+            # The aiohttp client is built on the SDK's own httpx variant, so
+            # build the Limits from that module - the values flow through to
+            # the underlying aiohttp.TCPConnector(limit=..., keepalive_timeout=...)
+            try:
+                import httpx2 as _httpx
+            except ImportError:
+                import httpx as _httpx
+            _shared_http_client = openai.DefaultAioHttpClient(
+                timeout=60.0,
+                limits=_httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive,
+                    keepalive_expiry=75.0,
+                ),
+            )
+            return _shared_http_client
+        except ImportError:
+            pass
+        import httpx
+        # HTTP/2 multiplexes concurrent requests over one connection instead
+        # of opening one TCP/TLS connection each; it needs the optional `h2`
+        # package (httpx[http2]), so fall back to HTTP/1.1 without it
+        try:
+            import h2  # noqa: F401
+            http2 = True
+        except ImportError:
+            http2 = False
+        _shared_http_client = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive,
+                keepalive_expiry=75.0,
+            ),
+            timeout=60.0,
+        )
+    return _shared_http_client
+
 class LanguageModel(ABC):
     @abstractmethod
     async def generate(self, messages: List[Message], tools: Optional[List['Tool']] = None, metadata: Optional[dict] = None) -> GenerationResult: # MODIFIED
@@ -19,7 +75,21 @@ class LanguageModel(ABC):
     def supports_native_tool_calling(self) -> bool:
         """Returns True if this model supports native tool calling, False if it needs manual prompting."""
         pass
-    
+
+    async def generate_stream(self, messages: List[Message], tools: Optional[List['Tool']] = None, metadata: Optional[dict] = None):
+        """
+        Yield StreamEvents for a generation; the final event carries the result.
+
+        Default implementation falls back to a buffered generate() call, so any
+        model works with streaming consumers; override for true token streaming.
+        """
+        result = await self.generate(messages, tools=tools, metadata=metadata)
+        if result.message.content:
+            yield StreamEvent(text=result.message.content)
+        for tool_call in result.message.tool_calls or []:
+            yield StreamEvent(tool_call=tool_call)
+        yield StreamEvent(result=result)
+
     def convert_tools_to_model_format(self, tools: Optional[List['Tool']]) -> Optional[List[dict]]:
         """Override this method to convert tools to the specific format needed by your model."""
         return None
@@ -62,7 +132,41 @@ class OpenAIModel(LanguageModel):
         
         if not self.api_key:
             raise ValueError("OpenAI API key is required. Set OPENAI_API_KEY environment variable or pass api_key parameter.")
-    
+
+        self._client = None
+
+    def _get_client(self):
+        """Create the AsyncOpenAI client once and reuse it across calls."""
+        if self._client is None:
+            import openai
+            self._client = openai.AsyncOpenAI(
+                api_key=self.api_key,
+                organization=self.organization,
+                base_url=self.base_url,
+                http_client=_get_shared_http_client(),
+            )
+        return self._client
+
+    async def warmup(self) -> None:
+        """
+        Prime the connection pool and tokenizer before the first real call.
+
+        Issues a cheap models.list request so DNS resolution and the TLS
+        handshake happen now (leaving a keep-alive connection in the pool),
+        and loads the tiktoken encoding so its regex tables are built. Meant
+        to be scheduled as a background task during startup; best-effort, so
+        any failure is swallowed and simply paid on the first real call.
+        """
+        try:
+            await self._get_client().models.list()
+        except Exception:
+            pass
+        try:
+            import tiktoken
+            tiktoken.encoding_for_model(self.model).encode("hi")
+        except Exception:
+            pass
+
     def supports_native_tool_calling(self) -> bool:
         """OpenAI supports native function calling."""
         return True
@@ -71,33 +175,12 @@ class OpenAIModel(LanguageModel):
         """Convert tools to OpenAI function calling format."""
         if not tools:
             return None
-            
-        openai_tools = []
-        for tool in tools:
-            schema = tool.args_schema.model_json_schema()
-            openai_tool = {
-                "type": "function",
-                "function": {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "parameters": schema
-                }
-            }
-            openai_tools.append(openai_tool)
-        return openai_tools
+
+        # Each spec is precomputed and cached on the tool instance
+        return [tool.openai_tool_spec for tool in tools]
     
-    async def generate(self, messages: List[Message], tools: Optional[List['Tool']] = None, metadata: Optional[dict] = None) -> GenerationResult: 
-        import openai
-        import json
-        
-        # Initialize OpenAI client with loaded credentials
-        client = openai.AsyncOpenAI(
-            api_key=self.api_key,
-            organization=self.organization,
-            base_url=self.base_url
-        )
-        
-        # Convert messages to OpenAI format
+    def _convert_messages(self, messages: List[Message]) -> List[dict]:
+        """Convert our Message objects to the OpenAI chat format."""
         openai_messages = []
         for msg in messages:
             if msg.role == "tool":
@@ -137,18 +220,20 @@ class OpenAIModel(LanguageModel):
                 if msg.content is not None:
                     message_dict["content"] = msg.content
                 openai_messages.append(message_dict)
-        
-        # Prepare API call parameters
+        return openai_messages
+
+    def _build_api_params(self, messages: List[Message], tools: Optional[List['Tool']], metadata: Optional[dict]) -> dict:
+        """Prepare the chat-completion parameters shared by generate/generate_stream."""
         api_params = {
             "model": self.model,
-            "messages": openai_messages,
+            "messages": self._convert_messages(messages),
             "max_tokens": self.max_tokens,
             "temperature": self.temperature,
             "top_p": self.top_p,
             "frequency_penalty": self.frequency_penalty,
             "presence_penalty": self.presence_penalty
         }
-        
+
         # Add metadata parameters if provided (for OpenAI-specific features)
         if metadata:
             # OpenAI-specific metadata handling
@@ -160,16 +245,26 @@ class OpenAIModel(LanguageModel):
                 api_params["response_format"] = metadata["response_format"]
             if "stream" in metadata:
                 api_params["stream"] = metadata["stream"]
+            if "cache_salt" in metadata:
+                # Deterministic prefix-cache scoping for vLLM-style backends;
+                # only sent when the caller opts in via metadata
+                api_params["extra_body"] = {"cache_salt": metadata["cache_salt"]}
             # Add any other OpenAI-specific parameters from metadata
-        
+
         # Add tools if provided (convert them to OpenAI format)
         openai_tools = self.convert_tools_to_model_format(tools)
         if openai_tools:
             api_params["tools"] = openai_tools
             api_params["tool_choice"] = "auto"
-        
+
+        return api_params
+
+    async def generate(self, messages: List[Message], tools: Optional[List['Tool']] = None, metadata: Optional[dict] = None) -> GenerationResult:
+        client = self._get_client()
+        api_params = self._build_api_params(messages, tools, metadata)
+
         # Call OpenAI API
-        response = await client.chat.completions.create(**api_params) 
+        response = await client.chat.completions.create(**api_params)
 
         # Extract message and token usage from the API response
         openai_message = response.choices[0].message
@@ -192,7 +287,7 @@ class OpenAIModel(LanguageModel):
         
         return GenerationResult(
             message=Message(
-                role="assistant", 
+                role="assistant",
                 content=message_content,
                 tool_calls=tool_calls
             ),
@@ -200,6 +295,144 @@ class OpenAIModel(LanguageModel):
             output_tokens=output_tokens,
         )
 
+    async def generate_stream(self, messages: List[Message], tools: Optional[List['Tool']] = None, metadata: Optional[dict] = None):
+        """
+        Stream a chat completion, yielding StreamEvents as data arrives.
+
+        Text deltas are yielded as they stream in; tool calls are yielded as soon
+        as their arguments JSON is complete (when the next tool call starts or the
+        stream ends), so callers can overlap tool execution with the rest of the
+        network transfer. The final event carries the assembled GenerationResult
+        with token usage.
+        """
+        from .schemas import ToolCall
+
+        client = self._get_client()
+        api_params = self._build_api_params(messages, tools, metadata)
+        api_params["stream"] = True
+        api_params["stream_options"] = {"include_usage": True}
+
+        content_parts = []
+        pending_tool_calls = {}  # index -> {"id", "name", "arguments"}
+        emitted = []  # ToolCalls already yielded, in order
+        input_tokens = output_tokens = 0
+
+        def _finalize(index) -> ToolCall:
+            raw = pending_tool_calls.pop(index)
+            tool_call = ToolCall(
+                id=raw["id"],
+                name=raw["name"],
+                arguments=json.loads(raw["arguments"]) if raw["arguments"] else {},
+            )
+            emitted.append(tool_call)
+            return tool_call
+
+        stream = await client.chat.completions.create(**api_params)
+        async for chunk in stream:
+            if chunk.usage:
+                input_tokens = chunk.usage.prompt_tokens
+                output_tokens = chunk.usage.completion_tokens
+            if not chunk.choices:
+                continue
+
+            delta = chunk.choices[0].delta
+            if delta.content:
+                content_parts.append(delta.content)
+                yield StreamEvent(text=delta.content)
+
+            for tc_delta in delta.tool_calls or []:
+                # A new index means every earlier call's arguments are complete
+                for index in sorted(pending_tool_calls):
+                    if index < tc_delta.index:
+                        yield StreamEvent(tool_call=_finalize(index))
+
+                raw = pending_tool_calls.setdefault(tc_delta.index, {"id": "", "name": "", "arguments": ""})
+                if tc_delta.id:
+                    raw["id"] = tc_delta.id
+                if tc_delta.function:
+                    if tc_delta.function.name:
+                        raw["name"] += tc_delta.function.name
+                    if tc_delta.function.arguments:
+                        raw["arguments"] += tc_delta.function.arguments
+
+        for index in sorted(pending_tool_calls):
+            yield StreamEvent(tool_call=_finalize(index))
+
+        content = "".join(content_parts) or None
+        yield StreamEvent(result=GenerationResult(
+            message=Message(
+                role="assistant",
+                content=content,
+                tool_calls=emitted or None
+            ),
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+        ))
+
+    async def batch_generate(self, batch_messages: List[List[Message]], poll_interval: float = 10.0) -> List[GenerationResult]:
+        """
+        Generate responses for many independent message lists via the OpenAI Batch API.
+
+        Batched requests cost ~50% less than real-time calls but complete
+        asynchronously (up to 24h, usually much faster), so this is only suitable
+        for offline/eval workloads, not interactive sessions. Results are returned
+        in the same order as `batch_messages`.
+        """
+        import asyncio
+        import io
+
+        client = self._get_client()
+
+        # Build the JSONL payload, one chat-completion request per line
+        lines = []
+        for i, messages in enumerate(batch_messages):
+            lines.append(json.dumps({
+                "custom_id": f"request-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": self._convert_messages(messages),
+                    "max_tokens": self.max_tokens,
+                    "temperature": self.temperature,
+                },
+            }))
+        payload = io.BytesIO("\n".join(lines).encode("utf-8"))
+
+        # Upload the file and create the batch job; the Files API requires a
+        # .jsonl filename for batch uploads, so name the in-memory payload
+        batch_file = await client.files.create(file=("batch.jsonl", payload), purpose="batch")
+        batch = await client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+
+        # Poll until the batch reaches a terminal state
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(poll_interval)
+            batch = await client.batches.retrieve(batch.id)
+
+        if batch.status != "completed":
+            raise RuntimeError(f"OpenAI batch {batch.id} finished with status '{batch.status}'")
+
+        # Download results and re-order them by custom_id
+        output = await client.files.content(batch.output_file_id)
+        results_by_id = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            body = entry["response"]["body"]
+            choice_message = body["choices"][0]["message"]
+            results_by_id[entry["custom_id"]] = GenerationResult(
+                message=Message(role="assistant", content=choice_message.get("content")),
+                input_tokens=body["usage"]["prompt_tokens"],
+                output_tokens=body["usage"]["completion_tokens"],
+            )
+
+        return [results_by_id[f"request-{i}"] for i in range(len(batch_messages))]
+
 # --- Example: Manual Tool Calling Model ---
 class ManualToolCallingModel(LanguageModel):
     """
@@ -230,8 +463,9 @@ class ManualToolCallingModel(LanguageModel):
                 "Available tools:"
             ])
             
+            from .tools import args_json_schema
             for tool in tools:
-                schema = tool.args_schema.model_json_schema()
+                schema = args_json_schema(tool.args_schema)
                 arguments_schema = schema.get("properties", {})
                 tool_def = f"""- {tool.name}: {tool.description}
   Parameters: {json.dumps(arguments_schema, indent=2)}"""
@@ -21,6 +21,14 @@ class GenerationResult(BaseModel):
     input_tokens: int
     output_tokens: int
 
+# A single event from a streaming generation. Text deltas arrive as `text`,
+# completed tool calls as `tool_call`, and the final event carries the fully
+# assembled GenerationResult in `result`.
+class StreamEvent(BaseModel):
+    text: Optional[str] = None
+    tool_call: Optional[ToolCall] = None
+    result: Optional[GenerationResult] = None
+
 # Custom message schema for MongoDB storage
 class MongoMessage(BaseModel):
     user_id: str
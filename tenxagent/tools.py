@@ -1,8 +1,21 @@
 # in tenxagent/tools.py
+import asyncio
+import functools
 from abc import ABC, abstractmethod
 from pydantic import BaseModel, Field
 from typing import Type, Dict, Any, Optional
 
+@functools.lru_cache(maxsize=None)
+def args_json_schema(args_schema: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    JSON schema for a tool's args model, cached per model class.
+
+    model_json_schema() is a relatively expensive reflective call, and many
+    tool instances (and agents) share the same args_schema class, so the
+    schema is derived once per class rather than once per instance.
+    """
+    return args_schema.model_json_schema()
+
 class Tool(ABC):
     name: str
     description: str
@@ -13,6 +26,34 @@ class Tool(ABC):
         """Executes the tool with validated arguments and optional metadata."""
         pass
 
+    async def aexecute(self, metadata: Dict[str, Any] = None, **kwargs) -> str:
+        """
+        Async execution hook; the agent dispatcher prefers this over execute.
+
+        By default the synchronous execute runs in a worker thread so it can't
+        block the event loop. Tools that are natively async (e.g. ones wrapping
+        another agent) should override this to await their work directly.
+        """
+        return await asyncio.to_thread(self.execute, metadata=metadata, **kwargs)
+
+    @functools.cached_property
+    def openai_tool_spec(self) -> Dict[str, Any]:
+        """
+        OpenAI function-calling spec for this tool.
+
+        name/description/args_schema are fixed for the tool's lifetime, so the
+        spec is built once per instance (and the underlying JSON schema once
+        per args_schema class) instead of on every generate call.
+        """
+        return {
+            "type": "function",
+            "function": {
+                "name": self.name,
+                "description": self.description,
+                "parameters": args_json_schema(self.args_schema),
+            },
+        }
+
 # --- Example Implementation ---
 class CalculatorInput(BaseModel):
     expression: str = Field(description="The mathematical expression to evaluate.")
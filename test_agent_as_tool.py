@@ -5,25 +5,90 @@ Test script to verify that create_tenx_agent_tool works properly.
 
 import asyncio
 import os
-from tenxagent import TenxAgent, OpenAIModel, Tool, safe_evaluate
-from tenxagent.agent import create_tenx_agent_tool
-from pydantic import BaseModel, Field
-
-# Simple calculator tool
-class CalculatorInput(BaseModel):
-    expression: str = Field(description="Mathematical expression to evaluate")
-
-class CalculatorTool(Tool):
-    name = "calculator"
-    description = "Evaluates mathematical expressions safely"
-    args_schema = CalculatorInput
-    
-    def execute(self, expression: str, metadata: dict = None) -> str:
-        try:
-            result = safe_evaluate(expression)
-            return f"Result: {result}"
-        except Exception as e:
-            return f"Error: {str(e)}"
+import functools
+import traceback
+
+# Full tracebacks are opt-in: walking and serializing frames on every failure
+# blocks the event loop during exception storms (rate limits, network blips)
+_DEBUG = bool(os.getenv("TENX_DEBUG"))
+
+# uvloop is a drop-in, faster event loop for I/O-bound workloads; fall back
+# to the stdlib loop when it isn't installed (e.g. on Windows)
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+# Static module-level prompts: provider-side prompt caching needs the prefix
+# byte-identical across calls, so nothing dynamic goes in here
+MATH_PROMPT = "You are a math assistant. Use the calculator for calculations."
+SPECIALIST_PROMPT = "You are a specialized math calculator. Always use the calculator tool for any arithmetic."
+MAIN_PROMPT = "You are a helpful assistant. Use the math specialist for any mathematical questions."
+
+@functools.lru_cache(maxsize=None)
+def get_llm():
+    """One OpenAIModel (and one connection pool) shared by every test agent."""
+    from tenxagent import OpenAIModel, CachedModel
+
+    llm = OpenAIModel(model="gpt-4o-mini", temperature=0.1)
+    # The test queries are fixed strings at near-zero temperature, so repeated
+    # identical calls can be answered from cache. Set TENX_CACHE=0 to disable.
+    if os.getenv("TENX_CACHE", "1") == "1":
+        llm = CachedModel(llm, temperature_threshold=0.1)
+    return llm
+
+@functools.lru_cache(maxsize=None)
+def build_calculator_tool():
+    """
+    Define and build the calculator tool on first use.
+
+    tenxagent/pydantic imports cost a good chunk of cold start, so they're
+    deferred here - the API-key checks in the tests can bail out before any
+    of that is paid.
+    """
+    from tenxagent import Tool, safe_evaluate
+    from pydantic import BaseModel, Field
+
+    # Simple calculator tool
+    class CalculatorInput(BaseModel):
+        expression: str = Field(description="Mathematical expression to evaluate")
+
+    class CalculatorTool(Tool):
+        name = "calculator"
+        description = "Evaluates mathematical expressions safely"
+        args_schema = CalculatorInput
+
+        # safe_evaluate is pure, so repeated expressions resolve to a dict lookup
+        _cached_eval = staticmethod(functools.lru_cache(maxsize=1024)(safe_evaluate))
+
+        def execute(self, expression: str, metadata: dict = None) -> str:
+            try:
+                result = self._cached_eval(expression)
+                return f"Result: {result}"
+            except Exception as e:
+                return f"Error: {str(e)}"
+
+    return CalculatorTool()
+
+@functools.lru_cache(maxsize=4)
+def get_math_agent(system_prompt: str, max_llm_calls: int, max_tokens: int):
+    """
+    One math agent per configuration, shared across tests.
+
+    Construction re-derives tool schemas and the composed system prompt, so
+    agents are pooled here instead of rebuilt per test. Sharing is safe: the
+    tests only run it with unique session_ids or wrap it as a tool.
+    """
+    from tenxagent import TenxAgent
+
+    return TenxAgent(
+        llm=get_llm(),
+        tools=[build_calculator_tool()],
+        system_prompt=system_prompt,
+        max_llm_calls=max_llm_calls,
+        max_tokens=max_tokens
+    )
 
 async def test_agent_as_tool():
     """Test creating an agent and using it as a tool."""
@@ -33,19 +98,12 @@ async def test_agent_as_tool():
         return
     
     print("🧪 Testing Agent as Tool...")
-    
-    # Create a math agent
-    llm = OpenAIModel(model="gpt-4o-mini", temperature=0.1)
-    calculator = CalculatorTool()
-    
-    math_agent = TenxAgent(
-        llm=llm,
-        tools=[calculator],
-        system_prompt="You are a math assistant. Use the calculator for calculations.",
-        max_llm_calls=5,
-        max_tokens=2000
-    )
-    
+
+    from tenxagent.agent import create_tenx_agent_tool
+
+    # Reuse the pooled math agent
+    math_agent = get_math_agent(MATH_PROMPT, 5, 2000)
+
     # Create an agent tool from the math agent
     try:
         math_tool = create_tenx_agent_tool(
@@ -64,9 +122,9 @@ async def test_agent_as_tool():
         print(f"✅ Tool result: {result}")
         
     except Exception as e:
-        print(f"❌ Error creating agent tool: {e}")
-        import traceback
-        traceback.print_exc()
+        print(f"❌ Error creating agent tool: {repr(e)}")
+        if _DEBUG:
+            traceback.print_exc()
 
 async def test_nested_agents():
     """Test using an agent tool within another agent."""
@@ -76,19 +134,13 @@ async def test_nested_agents():
         return
     
     print("\n🧪 Testing Nested Agents...")
-    
-    # Create a math specialist agent
-    llm = OpenAIModel(model="gpt-4o-mini", temperature=0.1)
-    calculator = CalculatorTool()
-    
-    math_agent = TenxAgent(
-        llm=llm,
-        tools=[calculator],
-        system_prompt="You are a specialized math calculator. Always use the calculator tool for any arithmetic.",
-        max_llm_calls=3,
-        max_tokens=1000
-    )
-    
+
+    from tenxagent import TenxAgent
+    from tenxagent.agent import create_tenx_agent_tool
+
+    # Reuse the pooled math specialist agent
+    math_agent = get_math_agent(SPECIALIST_PROMPT, 3, 1000)
+
     # Create a tool from the math agent
     math_tool = create_tenx_agent_tool(
         agent=math_agent,
@@ -98,9 +150,9 @@ async def test_nested_agents():
     
     # Create a main agent that uses the math tool
     main_agent = TenxAgent(
-        llm=llm,
+        llm=get_llm(),
         tools=[math_tool],
-        system_prompt="You are a helpful assistant. Use the math specialist for any mathematical questions.",
+        system_prompt=MAIN_PROMPT,
         max_llm_calls=5,
         max_tokens=2000
     )
@@ -114,14 +166,19 @@ async def test_nested_agents():
         print(f"✅ Nested agent result: {result}")
         
     except Exception as e:
-        print(f"❌ Error in nested agents: {e}")
-        import traceback
-        traceback.print_exc()
+        print(f"❌ Error in nested agents: {repr(e)}")
+        if _DEBUG:
+            traceback.print_exc()
 
 async def main():
     print("🚀 Testing Agent as Tool Functionality")
     print("=" * 50)
-    
+
+    # Warm the shared client (DNS/TLS) and tokenizer in the background so the
+    # first billed call doesn't pay cold-start latency
+    if os.getenv("OPENAI_API_KEY"):
+        warmup_task = asyncio.create_task(get_llm().warmup())
+
     await test_agent_as_tool()
     await test_nested_agents()
     
@@ -144,4 +144,105 @@ async def test_agent_stops_at_max_tokens(mock_llm, adder_tool):
     result = await agent.run("This is a query.", session_id="test_session")
 
     # Assert
-    assert result == "Error: Token limit reached."
\ No newline at end of file
+    assert result == "Error: Token limit reached."
+
+@pytest.mark.asyncio
+async def test_agent_prefers_async_tool_execution(mock_llm):
+    """Tests that a tool's aexecute override is awaited by the agent loop."""
+    from tenxagent.schemas import ToolCall
+
+    calls = []
+
+    class AsyncAdderTool(AdderTool):
+        async def aexecute(self, a: int, b: int, metadata: dict = None) -> str:
+            calls.append((a, b))
+            return str(a + b)
+
+    mock_llm.set_responses([
+        GenerationResult(
+            message=Message(role="assistant", content="", tool_calls=[ToolCall(id="call_1", name="adder", arguments={"a": 5, "b": 7})]),
+            input_tokens=50, output_tokens=20
+        ),
+        GenerationResult(
+            message=Message(role="assistant", content="5 plus 7 is 12."),
+            input_tokens=80, output_tokens=10
+        )
+    ])
+    agent = TenxAgent(llm=mock_llm, tools=[AsyncAdderTool()])
+
+    result = await agent.run("What is 5 plus 7?", session_id="test_session")
+
+    assert result == "5 plus 7 is 12."
+    assert calls == [(5, 7)]
+
+@pytest.mark.asyncio
+async def test_agent_run_batch_returns_results_in_order(mock_llm, adder_tool):
+    """Tests that run_batch answers each independent query through the agent loop."""
+    mock_llm.set_responses([
+        GenerationResult(message=Message(role="assistant", content="Answer."), input_tokens=10, output_tokens=5)
+    ])
+    agent = TenxAgent(llm=mock_llm, tools=[adder_tool])
+
+    results = await agent.run_batch(["First question?", "Second question?"])
+
+    assert results == ["Answer.", "Answer."]
+    assert mock_llm.call_count == 2
+
+@pytest.mark.asyncio
+async def test_agent_run_stream_yields_final_answer(mock_llm, adder_tool):
+    """Tests that run_stream streams the answer text for a simple response."""
+    mock_llm.set_responses([
+        GenerationResult(message=Message(role="assistant", content="The answer is 42."), input_tokens=10, output_tokens=5)
+    ])
+    agent = TenxAgent(llm=mock_llm, tools=[adder_tool])
+
+    chunks = [chunk async for chunk in agent.run_stream("What is the meaning of life?", session_id="stream_session")]
+
+    assert "".join(chunks) == "The answer is 42."
+
+@pytest.mark.asyncio
+async def test_agent_run_stream_handles_tool_calls(mock_llm, adder_tool):
+    """Tests that run_stream executes tool calls between streamed turns."""
+    from tenxagent.schemas import ToolCall
+    mock_llm.set_responses([
+        GenerationResult(
+            message=Message(role="assistant", content="", tool_calls=[ToolCall(id="call_1", name="adder", arguments={"a": 5, "b": 7})]),
+            input_tokens=50, output_tokens=20
+        ),
+        GenerationResult(
+            message=Message(role="assistant", content="5 plus 7 is 12."),
+            input_tokens=80, output_tokens=10
+        )
+    ])
+    agent = TenxAgent(llm=mock_llm, tools=[adder_tool])
+
+    chunks = [chunk async for chunk in agent.run_stream("What is 5 plus 7?", session_id="stream_session")]
+
+    assert "".join(chunks) == "5 plus 7 is 12."
+    assert mock_llm.call_count == 2
+
+@pytest.mark.asyncio
+async def test_agent_run_many_parses_combined_answers(mock_llm, adder_tool):
+    """Tests that run_many answers multiple queries from one combined JSON reply."""
+    mock_llm.set_responses([
+        GenerationResult(
+            message=Message(role="assistant", content='{"A0": "345", "A1": "Hello!"}'),
+            input_tokens=40, output_tokens=15
+        )
+    ])
+    agent = TenxAgent(llm=mock_llm, tools=[adder_tool])
+
+    answers = await agent.run_many(["What is 15 * 23?", "Say hi"])
+
+    assert answers == ["345", "Hello!"]
+    assert mock_llm.call_count == 1
+
+def test_agent_prefix_hash_is_stable(mock_llm, adder_tool):
+    """Tests that agents with identical configuration share a prefix hash."""
+    agent_a = TenxAgent(llm=mock_llm, tools=[adder_tool], system_prompt="Be helpful.")
+    agent_b = TenxAgent(llm=mock_llm, tools=[adder_tool], system_prompt="Be helpful.")
+    agent_c = TenxAgent(llm=mock_llm, tools=[adder_tool], system_prompt="Be terse.")
+
+    assert agent_a.prefix_hash == agent_a.prefix_hash
+    assert agent_a.prefix_hash == agent_b.prefix_hash
+    assert agent_a.prefix_hash != agent_c.prefix_hash
\ No newline at end of file
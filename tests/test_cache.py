@@ -0,0 +1,129 @@
+# in tests/test_cache.py
+
+import pytest
+from tenxagent.cache import CachedModel, SemanticCachedModel
+from tenxagent.models import LanguageModel
+from tenxagent.schemas import Message, GenerationResult
+
+
+class FakeModel(LanguageModel):
+    def __init__(self, temperature=0.0):
+        self.model = "fake-model"
+        self.temperature = temperature
+        self.call_count = 0
+
+    def supports_native_tool_calling(self) -> bool:
+        return True
+
+    async def generate(self, messages, tools=None, metadata=None) -> GenerationResult:
+        self.call_count += 1
+        return GenerationResult(
+            message=Message(role="assistant", content=f"Response #{self.call_count}"),
+            input_tokens=10,
+            output_tokens=5,
+        )
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_skips_base_model():
+    """Identical deterministic calls should only hit the base model once."""
+    base = FakeModel(temperature=0.0)
+    cached = CachedModel(base)
+    messages = [Message(role="user", content="Hello")]
+
+    first = await cached.generate(messages)
+    second = await cached.generate(messages)
+
+    assert base.call_count == 1
+    assert first.message.content == second.message.content == "Response #1"
+    assert cached.stats == {"hits": 1, "misses": 1, "tokens_saved": 15}
+
+
+@pytest.mark.asyncio
+async def test_different_messages_miss_the_cache():
+    base = FakeModel(temperature=0.0)
+    cached = CachedModel(base)
+
+    await cached.generate([Message(role="user", content="Hello")])
+    await cached.generate([Message(role="user", content="Goodbye")])
+
+    assert base.call_count == 2
+    assert cached.stats["misses"] == 2
+
+
+@pytest.mark.asyncio
+async def test_non_deterministic_calls_bypass_cache():
+    """High-temperature models should never be served from the cache."""
+    base = FakeModel(temperature=0.7)
+    cached = CachedModel(base)
+    messages = [Message(role="user", content="Hello")]
+
+    await cached.generate(messages)
+    await cached.generate(messages)
+
+    assert base.call_count == 2
+    assert cached.stats == {"hits": 0, "misses": 0, "tokens_saved": 0}
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_oldest_entries_beyond_max():
+    """The exact-match store should stay bounded, evicting LRU entries."""
+    base = FakeModel(temperature=0.0)
+    cached = CachedModel(base, max_entries=2)
+
+    await cached.generate([Message(role="user", content="One")])
+    await cached.generate([Message(role="user", content="Two")])
+    await cached.generate([Message(role="user", content="Three")])  # evicts "One"
+    await cached.generate([Message(role="user", content="One")])
+
+    assert len(cached._store) == 2
+    assert base.call_count == 4
+    assert cached.stats["hits"] == 0
+
+
+async def fake_embed(text: str):
+    """Deterministic toy embedding: paraphrases share a vector direction."""
+    if "15" in text:
+        return [1.0, 0.0]
+    return [0.0, 1.0]
+
+
+@pytest.mark.asyncio
+async def test_semantic_cache_serves_paraphrased_query():
+    base = FakeModel(temperature=0.0)
+    cached = SemanticCachedModel(base, embed_fn=fake_embed)
+
+    first = await cached.generate([Message(role="user", content="What is 15 * 23?")])
+    second = await cached.generate([Message(role="user", content="Calculate 15 times 23")])
+
+    assert base.call_count == 1
+    assert second.message.content == first.message.content
+    assert cached.stats["semantic_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_semantic_cache_fails_open_when_embedding_errors():
+    """An embeddings failure should fall through to the base model, not raise."""
+    async def broken_embed(text: str):
+        raise RuntimeError("embeddings API down")
+
+    base = FakeModel(temperature=0.0)
+    cached = SemanticCachedModel(base, embed_fn=broken_embed)
+
+    result = await cached.generate([Message(role="user", content="What is 15 * 23?")])
+
+    assert result.message.content == "Response #1"
+    assert base.call_count == 1
+    assert cached.stats["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_semantic_cache_misses_dissimilar_query():
+    base = FakeModel(temperature=0.0)
+    cached = SemanticCachedModel(base, embed_fn=fake_embed)
+
+    await cached.generate([Message(role="user", content="What is 15 * 23?")])
+    await cached.generate([Message(role="user", content="Tell me a joke")])
+
+    assert base.call_count == 2
+    assert cached.stats["semantic_hits"] == 0
@@ -0,0 +1,26 @@
+# in tests/test_tools.py
+
+from tenxagent.tools import CalculatorTool
+
+
+def test_openai_tool_spec_shape():
+    """The cached spec should follow the OpenAI function-calling format."""
+    tool = CalculatorTool()
+    spec = tool.openai_tool_spec
+
+    assert spec["type"] == "function"
+    assert spec["function"]["name"] == "calculator"
+    assert spec["function"]["description"] == tool.description
+    assert "expression" in spec["function"]["parameters"]["properties"]
+
+
+def test_openai_tool_spec_is_cached_per_instance():
+    tool = CalculatorTool()
+    assert tool.openai_tool_spec is tool.openai_tool_spec
+
+
+def test_args_schema_reflection_is_shared_across_instances():
+    """Instances sharing an args_schema class reuse one derived JSON schema."""
+    tool_a = CalculatorTool()
+    tool_b = CalculatorTool()
+    assert tool_a.openai_tool_spec["function"]["parameters"] is tool_b.openai_tool_spec["function"]["parameters"]